@@ -0,0 +1,152 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Helpers shared by the networkapi testsets
+"""
+FAILED_CMD_PREFIX = "FAILED: "
+# Marks the end of the output of each command run by run_cmds_batch
+BATCH_RC_PREFIX = "networkapi_batch_rc="
+# Printed by run_cmds_batch when its success command fails
+BATCH_SUCCESS_FAILED = "networkapi_batch_success_cmd_failed"
+# NICs leased by running tests, see lease_free_nic
+NIC_LEASE_DIR = "/tmp/networkapi_nic_leases"
+NIC_LEASE_MINS = 120
+
+
+def run_node_cmds(test, node, cmds):
+    """
+    Description:
+        Runs the given commands as root on a node in a single remote call
+        instead of one call per command. A failed command does not stop
+        the commands after it.
+    Args:
+        test (GenericTest): Test the commands are run for.
+        node (str): Filename of the node to run the commands on.
+        cmds (list): Commands to run, in order.
+    Returns:
+        list. The commands which failed.
+    """
+    if not cmds:
+        return []
+    batch_cmd = "; ".join(
+        "{0} >/dev/null 2>&1 || echo '{1}{0}'".format(cmd, FAILED_CMD_PREFIX)
+        for cmd in cmds)
+    std_out, _, _ = test.run_command(node, batch_cmd, su_root=True)
+    failed_cmds = [line[len(FAILED_CMD_PREFIX):] for line in std_out
+                   if line.startswith(FAILED_CMD_PREFIX)]
+    for cmd in failed_cmds:
+        test.log("info", "Command '{0}' failed on {1}".format(cmd, node))
+    return failed_cmds
+
+
+def lease_free_nic(test, node, node_url):
+    """
+    Description:
+        Leases a free NIC of a node, so that tests running at the same
+        time against the node never use the same NIC. The lease is a
+        directory on the node, created atomically, which is removed by
+        release_nic_lease or expires after NIC_LEASE_MINS.
+    Args:
+        test (GenericTest): Test leasing the NIC.
+        node (str): Filename of the node to lease a NIC on.
+        node_url (str): LITP model URL of the node.
+    Returns:
+        dict. NAME and MAC of the leased NIC.
+    """
+    free_nics = test.verify_backup_free_nics(
+        node, node_url, backup_files=False)
+    cmd = "mkdir -p {0} && find {0} -mindepth 1 -maxdepth 1 -type d " \
+          "-mmin +{1} -exec rmdir {{}} \\; ; for nic in {2}; do " \
+          "mkdir {0}/$nic 2>/dev/null && echo $nic && break; " \
+          "done".format(NIC_LEASE_DIR, NIC_LEASE_MINS,
+                        " ".join(nic["NAME"] for nic in free_nics))
+    std_out, _, _ = test.run_command(node, cmd)
+    test.assertNotEqual([], std_out,
+                        "No free NIC could be leased on {0}".format(node))
+
+    return [nic for nic in free_nics if nic["NAME"] == std_out[0]][0]
+
+
+def release_nic_lease(test, node, nic):
+    """
+    Description:
+        Releases a NIC leased with lease_free_nic.
+    Args:
+        test (GenericTest): Test which leased the NIC.
+        node (str): Filename of the node the NIC is on.
+        nic (dict): The leased NIC.
+    """
+    test.run_command(node, "rmdir {0}/{1}".format(NIC_LEASE_DIR, nic["NAME"]))
+
+
+def run_cmds_batch(test, node, cmds, success_cmd=None):
+    """
+    Description:
+        Runs several commands on a node in a single remote call and
+        returns the result of each of them separately.
+    Args:
+        test (GenericTest): Test the commands are run for.
+        node (str): Filename of the node to run the commands on.
+        cmds (list): Commands to run, in order.
+        success_cmd (str): Command to run after each command which
+            succeeds, such as the removal of an item it created. Asserts
+            that it succeeds each time it is run.
+    Returns:
+        list. (return code, stderr lines) of each command.
+    """
+    batch_cmds = []
+    for cmd in cmds:
+        batch_cmd = "({0}) 2>&1 >/dev/null; rc=$?".format(cmd)
+        if success_cmd:
+            batch_cmd += "; [ $rc -eq 0 ] && ! {0} >/dev/null 2>&1 && " \
+                         "echo '{1}'".format(success_cmd, BATCH_SUCCESS_FAILED)
+        batch_cmds.append('{0}; echo "{1}$rc"'.format(
+            batch_cmd, BATCH_RC_PREFIX))
+    std_out, _, _ = test.run_command(node, "; ".join(batch_cmds))
+
+    results = []
+    success_failed_cmds = []
+    cmd_output = []
+    for line in std_out:
+        if line.startswith(BATCH_RC_PREFIX):
+            results.append((line[len(BATCH_RC_PREFIX):], cmd_output))
+            cmd_output = []
+        elif line == BATCH_SUCCESS_FAILED:
+            success_failed_cmds.append(cmds[len(results)])
+        else:
+            cmd_output.append(line)
+    test.assertEqual(len(cmds), len(results),
+                     "Expected the result of {0} commands, got {1}.".format(
+                         len(cmds), len(results)))
+    test.assertEqual([], success_failed_cmds,
+                     "'{0}' failed after command(s): {1}".format(
+                         success_cmd, ", ".join(
+                             "'{0}'".format(cmd)
+                             for cmd in success_failed_cmds)))
+
+    return results
+
+
+def assert_all_texts_present(test, expected, lines, source):
+    """
+    Description:
+        Asserts that every expected text is present in the given lines.
+        All the missing texts are reported together.
+    Args:
+        test (GenericTest): Test making the assertion.
+        expected (list): Texts expected in the lines.
+        lines (list): Lines to search, such as the std_err of a command.
+        source (str): Where the lines come from, for the failure message.
+    """
+    missing = [text for text in expected
+               if not any(text in line for line in lines)]
+    test.assertEqual([], missing,
+                     "Expected text(s) not found in {0}: {1}".format(
+                         source, ", ".join("'{0}'".format(text)
+                                           for text in missing)))
@@ -15,6 +15,8 @@ program(s) have been supplied.
 from litp_generic_test import GenericTest, attr
 from xml_utils import XMLUtils
 import test_constants
+from networkapi_utils import lease_free_nic, release_nic_lease, \
+    run_node_cmds
 
 
 class Story2064(GenericTest):
@@ -61,67 +63,48 @@ class Story2064(GenericTest):
             super class prints out end test diagnostics
         """
         # 1. call teardown
-        super(Story2064, self).tearDown()
-
-        # DECONFIGURE test interface ON MS
-        if self.test_ms_if1 is not None:
-            cmd = "/sbin/ifdown {0}".format(self.test_ms_if1["NAME"])
-            self.run_command(self.ms_node, cmd, su_root=True)
-            cmd = "/sbin/ifdown {0}.{1}".format(self.test_ms_if1["NAME"],
-                                                self.VLAN1_ID)
-            self.run_command(self.ms_node, cmd, su_root=True)
-        if self.test_ms_if2 is not None:
-            cmd = "/sbin/ifdown {0}".format(self.test_ms_if2["NAME"])
-            self.run_command(self.ms_node, cmd, su_root=True)
-            cmd = "/sbin/ifdown {0}.{1}".format(self.test_ms_if2["NAME"],
-                                                self.VLAN2_ID)
-            self.run_command(self.ms_node, cmd, su_root=True)
-
-        # DECONFIGURE test interface ON MNs
-        all_nodes = self.get_managed_node_filenames()
-        for node in all_nodes:
-            if self.test_node_if1 is not None:
-                cmd = "/sbin/ifdown {0}".format(self.test_node_if1["NAME"])
-                self.run_command(node, cmd, su_root=True)
-                cmd = "/sbin/ifdown {0}.{1}".format(self.test_node_if1["NAME"],
-                                                    self.VLAN1_ID)
-                self.run_command(node, cmd, su_root=True)
-            if self.test_node_if2 is not None:
-                cmd = "/sbin/ifdown {0}".format(self.test_node_if2["NAME"])
-                self.run_command(node, cmd, su_root=True)
-                cmd = "/sbin/ifdown {0}.{1}".format(self.test_node_if2["NAME"],
-                                                    self.VLAN2_ID)
-                self.run_command(node, cmd, su_root=True)
-
-        # REMOVE VLAN IFCFG FILE ON MS
-        if self.test_ms_if1 is not None:
-            ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                test_constants.NETWORK_SCRIPTS_DIR, self.test_ms_if1["NAME"],
-                self.VLAN1_ID)
-            self.remove_item(self.ms_node, ifcfg_file, su_root=True)
-        if self.test_ms_if2 is not None:
-            ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                test_constants.NETWORK_SCRIPTS_DIR, self.test_ms_if2["NAME"],
-                self.VLAN2_ID)
-            self.remove_item(self.ms_node, ifcfg_file, su_root=True)
-
-        # REMOVE VLAN IFCFG FILE ON MNs
-        all_nodes = self.get_managed_node_filenames()
-        for node in all_nodes:
-            if self.test_node_if1 is not None:
-                ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                    test_constants.NETWORK_SCRIPTS_DIR,
-                    self.test_node_if1["NAME"],
-                    self.VLAN1_ID)
-                self.remove_item(node, ifcfg_file, su_root=True)
-            if self.test_node_if2 is not None:
-                ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                    test_constants.NETWORK_SCRIPTS_DIR,
-                    self.test_node_if2["NAME"],
-                    self.VLAN2_ID)
-                self.remove_item(node, ifcfg_file, su_root=True)
-
-    @attr('all', 'revert', 'story2064', 'story2064_tc27', 'kgb-other')
+        try:
+            super(Story2064, self).tearDown()
+
+            # DECONFIGURE test interface AND REMOVE VLAN IFCFG FILE ON MS
+            ms_cmds = \
+                self._get_cleanup_cmds(self.test_ms_if1, self.VLAN1_ID) + \
+                self._get_cleanup_cmds(self.test_ms_if2, self.VLAN2_ID)
+            run_node_cmds(self, self.ms_node, ms_cmds)
+
+            # DECONFIGURE test interface AND REMOVE VLAN IFCFG FILE ON MNs
+            mn_cmds = \
+                self._get_cleanup_cmds(self.test_node_if1, self.VLAN1_ID) + \
+                self._get_cleanup_cmds(self.test_node_if2, self.VLAN2_ID)
+            if mn_cmds:
+                for node in self.get_managed_node_filenames():
+                    run_node_cmds(self, node, mn_cmds)
+        finally:
+            if self.test_ms_if1 is not None:
+                release_nic_lease(self, self.ms_node, self.test_ms_if1)
+
+    @staticmethod
+    def _get_cleanup_cmds(test_if, vlan_id):
+        """
+        Description:
+            Gets the commands which deconfigure a test interface and its
+            VLAN and remove the VLAN ifcfg file.
+        Args:
+            test_if (dict): Test interface, or None if it was not used.
+            vlan_id (int): ID of the VLAN on the test interface.
+        Returns:
+            list. Cleanup commands, empty if the interface was not used.
+        """
+        if test_if is None:
+            return []
+        return ["/sbin/ifdown {0}".format(test_if["NAME"]),
+                "/sbin/ifdown {0}.{1}".format(test_if["NAME"], vlan_id),
+                "/bin/rm -f {0}/ifcfg-{1}.{2}".format(
+                    test_constants.NETWORK_SCRIPTS_DIR, test_if["NAME"],
+                    vlan_id)]
+
+    @attr('all', 'revert', 'story2064', 'story2064_tc27', 'kgb-other',
+          'item_bridge', 'item_eth')
     def test_27_n_validate_bridge_configured(self):
         """
             @tms_id:
@@ -152,10 +135,7 @@ class Story2064(GenericTest):
                 NA
             @tms_execution_type: Automated
         """
-        free_nics = \
-            self.verify_backup_free_nics(self.ms_node, "/ms",
-                                         backup_files=False)
-        self.test_ms_if1 = free_nics[0]
+        self.test_ms_if1 = lease_free_nic(self, self.ms_node, "/ms")
 
         # CREATE TEST BRIDGE
         br_url = "/ms/network_interfaces/br2064"
@@ -11,8 +11,11 @@ program(s) have been supplied.
 @summary:   Integration
             Agile: STORY LITPCDS-2069
 """
+import time
 from litp_generic_test import GenericTest, attr
 import test_constants
+from networkapi_utils import assert_all_texts_present, lease_free_nic, \
+    release_nic_lease
 
 
 class Story2069(GenericTest):
@@ -43,9 +46,7 @@ class Story2069(GenericTest):
         self.if_url = "{0}/network_interfaces/if_2069".format(self.ms_url)
         self.bond_ipaddress = '10.10.10.1'
 
-        free_nics = self.verify_backup_free_nics(
-            self.ms_node, self.ms_url, backup_files=False)
-        self.test_ms_if1 = free_nics[0]
+        self.test_ms_if1 = lease_free_nic(self, self.ms_node, self.ms_url)
         self.test_ms_if1_mac = self.test_ms_if1["MAC"]
         self.test_ms_if1_name = self.test_ms_if1["NAME"]
 
@@ -63,71 +64,55 @@ class Story2069(GenericTest):
             super class prints out end test diagnostics.
         """
         # 1. Call teardown
-        if self.test_passed:
-            super(Story2069, self).tearDown()
+        try:
+            if self.test_passed:
+                super(Story2069, self).tearDown()
+        finally:
+            release_nic_lease(self, self.ms_node, self.test_ms_if1)
 
     def _data_driven_test_verify(self, bond_props, node_urls):
         """
         Description:
-            Checks system configuration, output of run_plan. Returns any errors
+            Checks system configuration, output of run_plan. Asserts that
+            the ifcfg file of each bond exists on each node and holds the
+            bond properties.
         Args:
             bond_props (list): Bond properties
             node_urls (list): All nodes to be configured
-        Returns:
-            stderr (list): Any errors from checking configuration
         """
-        errors = []
-
-        for bond_prop in bond_props:
-            for node_url in node_urls:
-                self.log("info", "VERIFYING NODE {0}".format(node_url))
-                node_fname = self.get_node_filename_from_url(
-                    self.ms_node, node_url)
+        for node_url in node_urls:
+            self.log("info", "VERIFYING NODE {0}".format(node_url))
+            node_fname = self.get_node_filename_from_url(
+                self.ms_node, node_url)
 
+            for bond_prop in bond_props:
                 # CHECK BOND CONFIG FILE EXISTS
                 device_name = bond_prop["device_name"]
                 path = "{0}/ifcfg-{1}".format(
                     test_constants.NETWORK_SCRIPTS_DIR, device_name)
                 dir_contents = self.list_dir_contents(node_fname, path)
-                if dir_contents == []:
-                    errors.append("ifcfg-{0} doesn't exist".format(
-                        device_name))
+                self.assertNotEqual([], dir_contents,
+                                    "ifcfg-{0} doesn't exist on {1}".format(
+                                        device_name, node_fname))
 
                 # CHECK BOND FILE CONTENT
                 std_out = self.get_file_contents(node_fname, path)
 
-                if not self.is_text_in_list('DEVICE="{0}"'.format(
-                        device_name), std_out):
-                    errors.append('DEVICE="{0}" is not configured'.format(
-                        device_name))
-
-                if 'mode' in bond_props:
-                    mode = bond_prop["mode"]
-                    if not self.is_text_in_list("mode={0}".format(
-                            mode), std_out):
-                        errors.append("MODE is not configured")
-
-                if 'miimon' in bond_props:
-                    miimon = bond_prop["miimon"]
-                    if not self.is_text_in_list("miimon={0}".format(
-                            miimon), std_out):
-                        errors.append("MIIMON is not configured")
-
-                if 'ipaddress' in bond_props:
-                    ip_address = bond_prop["ipaddress"]
-                    if not self.is_text_in_list('IPADDR="{0}"'.format(
-                            ip_address), std_out):
-                        errors.append('IPADDR="{0}" is not configured'.format(
-                            ip_address))
-
-                if 'ipv6address' in bond_props:
-                    ipv6_address = bond_prop["ipv6address"]
-                    if not self.is_text_in_list('IPV6ADDR="{0}"'.format(
-                            ipv6_address), std_out):
-                        errors.append('IPV6ADDR="{0}" is not configured'
-                                      .format(ipv6_address))
-
-        return errors
+                expected = ['DEVICE="{0}"'.format(device_name)]
+                if 'mode' in bond_prop:
+                    expected.append("mode={0}".format(bond_prop["mode"]))
+                if 'miimon' in bond_prop:
+                    expected.append("miimon={0}".format(bond_prop["miimon"]))
+                if 'ipaddress' in bond_prop:
+                    expected.append('IPADDR="{0}"'.format(
+                        bond_prop["ipaddress"]))
+                if 'ipv6address' in bond_prop:
+                    expected.append('IPV6ADDR="{0}"'.format(
+                        bond_prop["ipv6address"]))
+
+                assert_all_texts_present(
+                    self, expected, std_out,
+                    "{0} on {1}".format(path, node_fname))
 
     def _register_cleanup_bonds(self):
         """
@@ -137,7 +122,27 @@ class Story2069(GenericTest):
         for node in self.mn_nodes:
             self.add_nic_to_cleanup(node, self.bond_name, is_bond=True)
 
-    @attr('all', 'revert', 'story2069', 'story2069_tc06')
+    def _run_plan_and_wait(self):
+        """
+        Description:
+            Creates and runs a LITP plan, registering the bonds for cleanup,
+            and asserts that the plan completes successfully.
+            Logs how long the plan took to complete.
+        """
+        self.execute_cli_createplan_cmd(self.ms_node)
+
+        self._register_cleanup_bonds()
+
+        start_time = time.time()
+        self.execute_cli_runplan_cmd(self.ms_node)
+        self.assertTrue(self.wait_for_plan_state(
+            self.ms_node, test_constants.PLAN_COMPLETE),
+            "Plan did not complete successfully.")
+        self.log("info", "Plan completed in {0:.1f} seconds.".format(
+            time.time() - start_time))
+
+    @attr('all', 'revert', 'story2069', 'story2069_tc06',
+          'item_bond', 'item_eth', 'item_network')
     def test_06_n_create_bonded_interface_with_ipaddress(self):
         """
         @tms_id: litpcds_2069_tc06
@@ -340,19 +345,11 @@ class Story2069(GenericTest):
 
         self.log("info", "14. Create/run LITP plan, wait "
                          "for it to complete successfully.")
-        self.execute_cli_createplan_cmd(self.ms_node)
-
-        self._register_cleanup_bonds()
-
-        self.execute_cli_runplan_cmd(self.ms_node)
-        self.assertTrue(self.wait_for_plan_state(
-            self.ms_node, test_constants.PLAN_COMPLETE),
-            "Plan did not complete successfully.")
+        self._run_plan_and_wait()
 
         self.log("info", "15. Check sysconfig file has correct configuration.")
         props = self.get_props_from_url(self.ms_node, self.bond_ms_url)
-        std_err = self._data_driven_test_verify([props], [self.ms_url])
-        self.assertEqual([], std_err)
+        self._data_driven_test_verify([props], [self.ms_url])
 
         self.log("info", "16. Check bonding file has correct configuration.")
         bonding_file = "/proc/net/bonding/{0}".format(self.bond_name)
@@ -368,14 +365,7 @@ class Story2069(GenericTest):
 
         self.log("info", "18. Create/run LITP plan, wait "
                          "for it to complete successfully.")
-        self.execute_cli_createplan_cmd(self.ms_node)
-
-        self._register_cleanup_bonds()
-
-        self.execute_cli_runplan_cmd(self.ms_node)
-        self.assertTrue(self.wait_for_plan_state(
-            self.ms_node, test_constants.PLAN_COMPLETE),
-            "Plan did not complete successfully.")
+        self._run_plan_and_wait()
 
         self.log("info", "19. Check bonding file has been updated correctly.")
         bond_params = self.get_file_contents(self.ms_node, bonding_file)
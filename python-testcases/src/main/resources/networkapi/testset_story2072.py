@@ -11,8 +11,11 @@ program(s) have been supplied.
 @summary:   Integration
             Agile: STORY LITPCDS-2072
 """
+import random
+import re
 from litp_generic_test import GenericTest, attr
 import test_constants
+from networkapi_utils import run_cmds_batch, run_node_cmds
 
 
 class Story2072(GenericTest):
@@ -26,6 +29,12 @@ class Story2072(GenericTest):
     test_node_if2 = None
     VLAN1_ID = 72
     VLAN2_ID = 73
+    # Interface name and VLAN ID separated by a dot
+    VLAN_DEVICE_NAME_REGEX = re.compile(r'^[a-zA-Z0-9]+\.([1-9][0-9]*)$')
+    # Longest interface name the kernel accepts (IFNAMSIZ - 1)
+    VLAN_DEVICE_NAME_MAX_LEN = 15
+    # Device names tried in each remote call of _check_vlan_device_names
+    VLAN_FUZZ_BATCH_SIZE = 20
 
     def setUp(self):
         """
@@ -60,63 +69,125 @@ class Story2072(GenericTest):
         # 1. Call teardown
         super(Story2072, self).tearDown()
 
-        # DECONFIGURE test interface on MS
-        if self.test_ms_if1 is not None:
-            cmd = "/sbin/ip link del {0}.{1}".format(
-                self.test_ms_if1["NAME"], self.VLAN1_ID)
-            self.run_command(self.ms_node, cmd, su_root=True)
-            cmd = "/sbin/ifdown {0}".format(self.test_ms_if1["NAME"])
-            self.run_command(self.ms_node, cmd, su_root=True)
-        if self.test_ms_if2 is not None:
-            cmd = "/sbin/ip link del {0}.{1}".format(
-                self.test_ms_if2["NAME"], self.VLAN2_ID)
-            self.run_command(self.ms_node, cmd, su_root=True)
-            cmd = "/sbin/ifdown {0}".format(self.test_ms_if2["NAME"])
-            self.run_command(self.ms_node, cmd, su_root=True)
-
-        # DECONFIGURE test interface on MNs
-        all_nodes = self.get_managed_node_filenames()
-        for node in all_nodes:
-            if self.test_node_if1 is not None:
-                cmd = "/sbin/ip link del {0}.{1}".format(
-                    self.test_node_if1["NAME"], self.VLAN1_ID)
-                self.run_command(node, cmd, su_root=True)
-                cmd = "/sbin/ifdown {0}".format(
-                    self.test_node_if1["NAME"])
-                self.run_command(node, cmd, su_root=True)
-            if self.test_node_if2 is not None:
-                cmd = "/sbin/ip link del {0}.{1}".format(
-                    self.test_node_if2["NAME"], self.VLAN2_ID)
-                self.run_command(node, cmd, su_root=True)
-                cmd = "/sbin/ifdown {0}".format(
-                    self.test_node_if2["NAME"])
-                self.run_command(node, cmd, su_root=True)
-
-        # REMOVE VLAN IFCFG FILE ON MS
-        if self.test_ms_if1 is not None:
-            ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                test_constants.NETWORK_SCRIPTS_DIR, self.test_ms_if1["NAME"],
-                self.VLAN1_ID)
-            self.remove_item(self.ms_node, ifcfg_file, su_root=True)
-        if self.test_ms_if2 is not None:
-            ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                test_constants.NETWORK_SCRIPTS_DIR, self.test_ms_if2["NAME"],
-                self.VLAN2_ID)
-            self.remove_item(self.ms_node, ifcfg_file, su_root=True)
-
-        # REMOVE VLAN IFCFG FILE ON MNs
-        all_nodes = self.get_managed_node_filenames()
-        for node in all_nodes:
-            if self.test_node_if1 is not None:
-                ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                    test_constants.NETWORK_SCRIPTS_DIR,
-                    self.test_node_if1["NAME"], self.VLAN1_ID)
-                self.remove_item(node, ifcfg_file, su_root=True)
-            if self.test_node_if2 is not None:
-                ifcfg_file = "{0}/ifcfg-{1}.{2}".format(
-                    test_constants.NETWORK_SCRIPTS_DIR,
-                    self.test_node_if2["NAME"], self.VLAN2_ID)
-                self.remove_item(node, ifcfg_file, su_root=True)
+        # DECONFIGURE test interface AND REMOVE VLAN IFCFG FILE on MS
+        ms_cmds = self._get_cleanup_cmds(self.test_ms_if1, self.VLAN1_ID) + \
+            self._get_cleanup_cmds(self.test_ms_if2, self.VLAN2_ID)
+        run_node_cmds(self, self.ms_node, ms_cmds)
+
+        # DECONFIGURE test interface AND REMOVE VLAN IFCFG FILE on MNs
+        mn_cmds = self._get_cleanup_cmds(self.test_node_if1, self.VLAN1_ID) + \
+            self._get_cleanup_cmds(self.test_node_if2, self.VLAN2_ID)
+        if mn_cmds:
+            for node in self.get_managed_node_filenames():
+                run_node_cmds(self, node, mn_cmds)
+
+    @staticmethod
+    def _get_cleanup_cmds(test_if, vlan_id):
+        """
+        Description:
+            Gets the commands which delete the VLAN on a test interface,
+            deconfigure the interface and remove the VLAN ifcfg file.
+        Args:
+            test_if (dict): Test interface, or None if it was not used.
+            vlan_id (int): ID of the VLAN on the test interface.
+        Returns:
+            list. Cleanup commands, empty if the interface was not used.
+        """
+        if test_if is None:
+            return []
+        return ["/sbin/ip link del {0}.{1}".format(test_if["NAME"], vlan_id),
+                "/sbin/ifdown {0}".format(test_if["NAME"]),
+                "/bin/rm -f {0}/ifcfg-{1}.{2}".format(
+                    test_constants.NETWORK_SCRIPTS_DIR, test_if["NAME"],
+                    vlan_id)]
+
+    def _is_valid_vlan_device_name(self, device_name):
+        """
+        Description:
+            Reference check of whether LITP accepts a VLAN device_name
+            generated by _get_fuzz_device_names.
+        Args:
+            device_name (str): VLAN device name.
+        Returns:
+            bool. True if the device name is valid.
+        """
+        if len(device_name) > self.VLAN_DEVICE_NAME_MAX_LEN:
+            return False
+        match = self.VLAN_DEVICE_NAME_REGEX.match(device_name)
+        return match is not None and int(match.group(1)) <= 4094
+
+    @staticmethod
+    def _get_fuzz_device_names(count, seed):
+        """
+        Description:
+            Generates VLAN device names from a simple grammar of interface
+            name, separator and VLAN ID. Three in four names follow it,
+            with VLAN IDs spread over the 1-4094 range. The rest break one
+            part of the grammar. Some interface names are long enough for
+            the name to exceed VLAN_DEVICE_NAME_MAX_LEN with longer VLAN
+            IDs, and one is too long whatever the VLAN ID.
+        Args:
+            count (int): Number of device names to generate.
+            seed (int): Seed of the generator, so runs can be repeated.
+        Returns:
+            list. Generated device names, without duplicates.
+        """
+        rand = random.Random(seed)
+        if_names = ['eth0', 'eth9', 'eth72', 'bond0', 'br0', 'em1',
+                    'eth4567890', 'eth45678901']
+        invalid_if_names = ['', 'eth9.10', 'eth9.', 'eth456789012345']
+        invalid_separators = ['', '..', '_', ':']
+        invalid_vlan_ids = ['', '0', '4095', '10000', 'eth10', '1a']
+
+        device_names = []
+        while len(device_names) < count:
+            if_name = rand.choice(if_names)
+            separator = '.'
+            vlan_id = str(rand.randint(1, 4094))
+            # Break one part of the grammar in one name out of four
+            part = rand.randint(0, 11)
+            if part == 1:
+                if_name = rand.choice(invalid_if_names)
+            elif part == 2:
+                separator = rand.choice(invalid_separators)
+            elif part == 3:
+                vlan_id = rand.choice(
+                    invalid_vlan_ids + [str(rand.randint(4095, 9999))])
+            device_name = if_name + separator + vlan_id
+            if device_name not in device_names:
+                device_names.append(device_name)
+
+        return device_names
+
+    def _check_vlan_device_names(self, device_names):
+        """
+        Description:
+            Attempts to create a VLAN with each device name and removes
+            any VLAN which was created. The device names are tried on the
+            MS in batches of VLAN_FUZZ_BATCH_SIZE, one command per batch.
+        Args:
+            device_names (list): VLAN device names to try.
+        Returns:
+            list. Device names whose create result did not match
+            _is_valid_vlan_device_name.
+        """
+        mismatches = []
+        for start in range(0, len(device_names), self.VLAN_FUZZ_BATCH_SIZE):
+            batch = device_names[start:start + self.VLAN_FUZZ_BATCH_SIZE]
+            create_cmds = [self.cli.get_create_cmd(
+                self.vlan_url, "vlan", self.vlan_props.format(device_name))
+                for device_name in batch]
+            results = run_cmds_batch(
+                self, self.ms_node, create_cmds,
+                success_cmd=self.cli.get_remove_cmd(self.vlan_url))
+
+            mismatches.extend(
+                device_name for device_name, (ret_code, _)
+                in zip(batch, results)
+                if (ret_code == "0") !=
+                self._is_valid_vlan_device_name(device_name))
+
+        return mismatches
 
     def _create_invalid_vlan(self, vlan_id):
         """
@@ -144,7 +215,7 @@ class Story2072(GenericTest):
         self.assertFalse(self.is_text_in_list(
             "Device must not be already tagged", std_err))
 
-    @attr('all', 'revert', 'story2072', 'story2072_tc10')
+    @attr('all', 'revert', 'story2072', 'story2072_tc10', 'item_vlan')
     def test_10_n_validation_vlan_id(self):
         """
         @tms_id: litpcds_2072_tc10
@@ -246,3 +317,34 @@ class Story2072(GenericTest):
         self.assertTrue(
             self.is_text_in_list(expected_err, std_err),
             "Expected error '{0}' not returned.".format(expected_err))
+
+    @attr('revert', 'story2072', 'story2072_tc11', 'story2072_fuzz',
+          'item_vlan')
+    def test_11_n_fuzz_vlan_device_name(self):
+        """
+        @tms_id: litpcds_2072_tc11
+        @tms_requirements_id: LITPCDS-2072
+        @tms_title: test_11_n_fuzz_vlan_device_name
+        @tms_description: Only VLAN items with a valid device_name are
+            created, for device names generated from a grammar of
+            interface name, separator and VLAN ID. Opt-in, not part of
+            the 'all' set of tests.
+        @tms_test_steps:
+            @step: Create network VLAN items with 200 generated
+                device_name values, mostly with VLAN IDs in range 1-4094
+                and some longer than 15 characters
+            @result: Creation succeeds for each valid device_name
+            @result: Creation fails for each invalid device_name
+            @result: Each created VLAN item is removed again
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.log("info", "1. Attempt to create VLAN items with generated "
+                         "device names. Assert that only VLANs with valid "
+                         "device names are created.")
+        device_names = self._get_fuzz_device_names(200, seed=2072)
+        mismatches = self._check_vlan_device_names(device_names)
+        self.assertEqual([], mismatches,
+                         "Unexpected create result for device name(s): "
+                         "{0}".format(", ".join(
+                             "'{0}'".format(name) for name in mismatches)))
@@ -53,7 +53,8 @@ class Story225(GenericTest):
         # 1. Call teardown
         super(Story225, self).tearDown()
 
-    @attr('all', 'revert', 'story225', 'story225_tc11')
+    @attr('all', 'revert', 'story225', 'story225_tc11',
+          'item_bridge', 'item_eth')
     def test_11_p_validate_default_values(self):
         """
         @tms_id: litpcds_225_tc11
@@ -92,14 +93,12 @@ class Story225(GenericTest):
 
         self.log("info", "2. Check that default value 'stp' has "
                          "been created with correct value.")
-        stp_prop = self.get_props_from_url(self.ms_node, self.br_url, "stp")
-        self.assertEqual("false", stp_prop)
+        br_props = self.get_props_from_url(self.ms_node, self.br_url)
+        self.assertEqual("false", br_props["stp"])
 
         self.log("info", "3. Check that default value 'forwarding_delay' has "
                          "been created with correct value.")
-        fwd_delay_prop = self.get_props_from_url(
-            self.ms_node, self.br_url, "forwarding_delay")
-        self.assertEqual("4", fwd_delay_prop)
+        self.assertEqual("4", br_props["forwarding_delay"])
 
         self.log("info", "4. Remove previously created bridge item.")
         self.execute_cli_remove_cmd(self.ms_node, self.br_url)
@@ -12,7 +12,11 @@ program(s) have been supplied.
 @summary:   Integration
             Agile: STORY LITPCDS-5175
 """
+import binascii
+import random
+import socket
 from litp_generic_test import GenericTest, attr
+from networkapi_utils import assert_all_texts_present, run_cmds_batch
 
 
 class Story5175(GenericTest):
@@ -21,6 +25,13 @@ class Story5175(GenericTest):
         As a LITP User, I want to create IPv6 routes,
         so I can control connectivity to remote networks
     """
+    # IPv6 blocks which the IANA IPv6 address space registry lists as
+    # reserved by the IETF and which were never assigned, so route6
+    # subnets and gateways cannot be in them
+    RESERVED_IPV6_NETWORKS = ['0000::/8', '0100::/8', '0200::/7', '0400::/6',
+                              '0800::/5', '1000::/4', '4000::/3', '6000::/3',
+                              '8000::/3', 'a000::/3', 'c000::/3', 'e000::/4',
+                              'f000::/5', 'f800::/6', 'fe00::/9']
 
     def setUp(self):
         """
@@ -37,8 +48,6 @@ class Story5175(GenericTest):
         super(Story5175, self).setUp()
         # 2. Set up variables used in the test
         self.ms_node = self.get_management_node_filename()
-        self.test_nodes = self.get_managed_node_filenames()
-        self.test_nodes.sort()
 
         self.test_route = "route6"
         self.route_url = self.find(self.ms_node, "/infrastructure",
@@ -73,36 +82,146 @@ class Story5175(GenericTest):
         # 1. Call teardown
         super(Story5175, self).tearDown()
 
-    def invalid_subnet_gateway_props(self, sub_props, gw_props, errors):
+    def _get_route_props(self, sub_props, gw_props):
         """
         Description:
-            Attempts to create a route6 item with
-                the given subnet and gateway properties.
-            Asserts that item creation fails and throws the expected errors.
+            Builds the property string of a route6 item.
         Args:
             sub_props (str): Subnet value. Pass in 'None' to not set at all
             gw_props (str): Gateway value. Pass in 'None' to not set at all
-            errors (list): Expected errors from failed creation
+        Returns:
+            str. The route6 properties to pass to 'litp create'
         """
-        # Set subnet and gateway properties
         if sub_props is None and gw_props:
-            route_props = "gateway='{0}'".format(gw_props)
-        elif gw_props is None and sub_props:
-            route_props = "subnet='{0}'".format(sub_props)
-        else:
-            route_props = self.subnet_gw_props.format(sub_props, gw_props)
-
-        # Attempt to create the item
-        _, std_err, _ = self.execute_cli_create_cmd(
-            self.ms_node, self.route_path, self.test_route,
-            route_props, expect_positive=False)
-
-        # Ensure all expected errors are returned
-        for err in errors:
-            self.assertTrue(self.is_text_in_list(err, std_err),
-                            "Expected error '{0}' not returned.".format(err))
-
-    @attr('all', 'revert', 'story5175', 'story5175_tc14')
+            return "gateway='{0}'".format(gw_props)
+        if gw_props is None and sub_props:
+            return "subnet='{0}'".format(sub_props)
+        return self.subnet_gw_props.format(sub_props, gw_props)
+
+    @staticmethod
+    def _ipv6_to_int(address):
+        """
+        Description:
+            Converts an IPv6 address to its 128 bit integer value.
+        Args:
+            address (str): IPv6 address, without prefix length.
+        Returns:
+            int. Value of the address.
+        """
+        return int(binascii.hexlify(
+            socket.inet_pton(socket.AF_INET6, address)), 16)
+
+    @staticmethod
+    def _int_to_ipv6(value):
+        """
+        Description:
+            Converts a 128 bit integer value to an IPv6 address.
+        Args:
+            value (int): Value of the address.
+        Returns:
+            str. IPv6 address in its shortest form.
+        """
+        return socket.inet_ntop(
+            socket.AF_INET6, binascii.unhexlify("{0:032x}".format(value)))
+
+    def _get_reserved_network(self, address):
+        """
+        Description:
+            Finds the reserved IPv6 network an address or subnet is in.
+        Args:
+            address (str): IPv6 address, with or without prefix length.
+        Returns:
+            str. The reserved network, or None if the address is not in one.
+        """
+        address_parts = address.split('/')
+        address_val = self._ipv6_to_int(address_parts[0])
+        address_len = int(address_parts[1]) if len(address_parts) > 1 \
+            else 128
+        for network in self.RESERVED_IPV6_NETWORKS:
+            network_addr, prefix_len = network.split('/')
+            shift = 128 - int(prefix_len)
+            if address_len >= int(prefix_len) and address_val >> shift == \
+                    self._ipv6_to_int(network_addr) >> shift:
+                return network
+        return None
+
+    def _assert_reserved(self, addresses, reserved=True):
+        """
+        Description:
+            Asserts that each address or subnet is, or is not, in one of
+                the reserved IPv6 networks.
+        Args:
+            addresses (list): IPv6 addresses, with or without prefix length.
+            reserved (bool): Whether the addresses are expected to be in a
+                reserved network.
+        """
+        mismatches = [address for address in addresses
+                      if (self._get_reserved_network(address) is not None)
+                      != reserved]
+        self.assertEqual([], mismatches,
+                         "Expected {0} {1}to be in a reserved IPv6 "
+                         "network".format(mismatches,
+                                          "" if reserved else "not "))
+
+    def _get_reserved_gateways(self, count, seed):
+        """
+        Description:
+            Generates random IPv6 addresses in the reserved IPv6 networks.
+            Addresses whose first 16 bits are zero are left out, as the
+            undefined, loopback and IPv4 compatible addresses there are
+            rejected with their own errors.
+        Args:
+            count (int): Number of addresses to generate.
+            seed (int): Seed of the generator, so runs can be repeated.
+        Returns:
+            list. Generated addresses, without duplicates.
+        """
+        rand = random.Random(seed)
+        addresses = []
+        while len(addresses) < count:
+            network_addr, prefix_len = rand.choice(
+                self.RESERVED_IPV6_NETWORKS).split('/')
+            address_val = self._ipv6_to_int(network_addr) | \
+                rand.getrandbits(128 - int(prefix_len))
+            address = self._int_to_ipv6(address_val)
+            if address_val >> 112 and address not in addresses:
+                addresses.append(address)
+
+        return addresses
+
+    def invalid_subnet_gateway_props_batch(self, rows):
+        """
+        Description:
+            Attempts to create a route6 item for every row of subnet and
+                gateway properties, using a single command on the MS.
+            Asserts that each item creation fails and throws the
+                expected errors.
+        Args:
+            rows (list): (subnet, gateway, errors) tuples. Pass in None as
+                the subnet or gateway to not set it at all. The errors are
+                all expected from the failed creation.
+        """
+        # Run every create in one script, removing the item again if a
+        # create unexpectedly succeeds so it cannot affect later rows
+        route_props = [self._get_route_props(sub_props, gw_props)
+                       for sub_props, gw_props, _ in rows]
+        create_cmds = [self.cli.get_create_cmd(
+            self.route_path, self.test_route, props) for props in route_props]
+        results = run_cmds_batch(
+            self, self.ms_node, create_cmds,
+            success_cmd=self.cli.get_remove_cmd(self.route_path))
+
+        # Ensure each create failed with all of its expected errors
+        for props, (_, _, errors), (ret_code, std_err) in \
+                zip(route_props, rows, results):
+            self.assertNotEqual("0", ret_code,
+                                "Creation of route6 item with {0} did not "
+                                "fail.".format(props))
+            assert_all_texts_present(
+                self, errors, std_err,
+                "the errors of route6 create with {0}".format(props))
+
+    @attr('all', 'revert', 'story5175', 'story5175_tc14', 'item_route6')
     def test_14_n_validate_route6_item(self):
         """
         @tms_id: litpcds_5175_tc14
@@ -117,39 +236,43 @@ class Story5175(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
+        # Each step adds the rows of its creates, which are all run
+        # together in a single command on the MS in the last step
+        rows = []
+
         self.log("info", "1. Create route6 item without subnet prefix.")
         subprops = '2121::'
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, self.subnet_prefix_err]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "2. Create route6 item without specifying gateway.")
         subprops = '2121::/64'
         errors = [self.missing_prop.format('gateway'),
                   self.required_prop.format(self.test_route, 'gateway')]
-        self.invalid_subnet_gateway_props(subprops, None, errors)
+        rows.append((subprops, None, errors))
 
         self.log("info", "3. Create route6 item without specifying subnet.")
         errors = [self.missing_prop.format('subnet'),
                   self.required_prop.format(self.test_route, 'subnet')]
-        self.invalid_subnet_gateway_props(None, gwprops, errors)
+        rows.append((None, gwprops, errors))
 
         self.log("info", "4. Create route6 item without value for gateway.")
         subprops = '2001::/48'
         errors = [self.gw_val_err, self.invalid_value.format('')]
-        self.invalid_subnet_gateway_props(subprops, '', errors)
+        rows.append((subprops, '', errors))
 
         self.log("info", "5. Create route6 item with empty value for gateway.")
         errors = [self.gw_val_err, self.invalid_value.format('')]
-        self.invalid_subnet_gateway_props(subprops, ' ', errors)
+        rows.append((subprops, ' ', errors))
 
         self.log("info", "6. Create route6 item without value for subnet.")
         errors = [self.subnet_val_err, self.invalid_value.format('')]
-        self.invalid_subnet_gateway_props('', gwprops, errors)
+        rows.append(('', gwprops, errors))
 
         self.log("info", "7. Create route6 item with empty value for subnet.")
         errors = [self.subnet_val_err, self.invalid_value.format('')]
-        self.invalid_subnet_gateway_props(' ', gwprops, errors)
+        rows.append((' ', gwprops, errors))
 
         self.log("info", "8. Create route6 item without "
                          "values for subnet or gateway.")
@@ -159,25 +282,25 @@ class Story5175(GenericTest):
         ipv6_addr = "{0} {1}".format(
             self.invalid_value.format(''), self.value_ipv6.format('address'))
         errors = [self.subnet_val_err, self.gw_val_err, ipv6_nw, ipv6_addr]
-        self.invalid_subnet_gateway_props('', '', errors)
+        rows.append(('', '', errors))
 
         self.log("info", "9. Create route6 item with "
                          "empty values for subnet and gateway.")
-        self.invalid_subnet_gateway_props(' ', ' ', errors)
+        rows.append((' ', ' ', errors))
 
         self.log("info", "10. Create route6 item with more than "
                          "one replaced group of zeros for subnet.")
         subprops = '2000:::/48'
         gwprops = '2001:DB8:0:0:800:27FF:FE00:0'
         errors = [self.subnet_val_err, self.invalid_ipv6_sub.format(subprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "11. Create route6 item with more than "
                          "one replaced group of zeros for gateway.")
         subprops = '2000::/48'
         gwprops = '2001:DB8:::0'
         errors = [self.gw_val_err, self.invalid_ipv6_val.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "12. Create route6 item with more than one "
                          "replaced group of zeros for subnet and gateway.")
@@ -185,26 +308,26 @@ class Story5175(GenericTest):
         errors = [self.gw_val_err, self.subnet_val_err,
                   self.invalid_ipv6_sub.format(subprops),
                   self.invalid_ipv6_val.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "13. Create route6 item with '/' in "
                          "subnet but without defining prefix length.")
         subprops = '2121::/'
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, self.invalid_ipv6_sub.format(subprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "14. Create route6 item with '\\' in subnet.")
         subprops = '2001:DB8::dc\\71'
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, self.invalid_value.format(subprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "15. Create route6 item with '\\' in gateway.")
         subprops = '2121::/64'
         gwprops = '2001:DB8::dc\\71'
         errors = [self.gw_val_err, self.invalid_value.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "16. Create route6 item with"
                          " '\\' in suvbnet and gateway.")
@@ -213,37 +336,37 @@ class Story5175(GenericTest):
         errors = [self.subnet_val_err, self.gw_val_err,
                   self.invalid_value.format(subprops),
                   self.invalid_value.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "17. Create route6 item with '\\\\' in gateway.")
         subprops = '2001:DB8::dc71/48'
         gwprops = '2001:b\\\\::1:1'
         errors = [self.gw_val_err, self.invalid_value.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "18. Create route6 item with invalid subnet.")
         subprops = 'xxx::xxx/64'
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, self.invalid_value.format(subprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "19. Create route6 item with invalid gateway.")
         subprops = '::/0'
         gwprops = '2001:xx::1:1'
         errors = [self.gw_val_err, self.invalid_ipv6_val.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "20. Create route6 item with multicast in gateway.")
         gwprops = 'ff01::300'
         errors = [self.gw_val_err, "Cannot use multicast "
                                    "address {0} as gateway".format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         self.log("info", "21. Create route6 item with multicast in subnet.")
         subprops = 'ff01::300/64'
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, "Subnet cannot be a multicast address."]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
 
         # START test_16_n_validate_subnet_prefix
         self.log("info", "22. Create route6 item where subnet property "
@@ -252,7 +375,7 @@ class Story5175(GenericTest):
         err = "Routing destination '2121::' cannot have prefix length 0, " \
               "because it is reserved for the default route only (::/0)."
         errors = [self.subnet_val_err, err]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_16_n_validate_subnet_prefix
 
         # START test_17_n_create_route6_with_loopback_address_gateway
@@ -263,7 +386,7 @@ class Story5175(GenericTest):
         err = "The gateway address {0} cannot " \
               "be local loopback.".format(gwprops)
         errors = [self.gw_val_err, err]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_17_n_create_route6_with_loopback_address_gateway
 
         # START test_18_n_create_route6_with_loopback_address_subnet
@@ -272,7 +395,7 @@ class Story5175(GenericTest):
         subprops = '::1/128'
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, self.reserved_nw]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_18_n_create_route6_with_loopback_address_subnet
 
         # START test_19_n_create_route6_with_unspecified_address_gateway
@@ -283,7 +406,7 @@ class Story5175(GenericTest):
         err = "The gateway address {0} cannot " \
               "be the undefined address.".format(gwprops)
         errors = [self.gw_val_err, err]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_19_n_create_route6_with_unspecified_address_gateway
 
         # START test_20_n_create_route6_with_unspecified_address_subnet
@@ -292,7 +415,7 @@ class Story5175(GenericTest):
         subprops = '::/128'
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, self.reserved_nw]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_20_n_create_route6_with_unspecified_address_subnet
 
         # START test_21_n_create_route6_with_ipv4_subnet_for_gateway
@@ -300,7 +423,7 @@ class Story5175(GenericTest):
         subprops = '::/0'
         gwprops = '10.0.0.0'
         errors = [self.gw_val_err, self.invalid_value.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_21_n_create_route6_with_ipv4_subnet_for_gateway
 
         # START test_22_n_create_route6_with_ipv4_addr_for_gw_and_sub
@@ -311,14 +434,14 @@ class Story5175(GenericTest):
         errors = [self.subnet_val_err, self.gw_val_err,
                   self.invalid_value.format(subprops),
                   self.invalid_value.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_22_n_create_route6_with_ipv4_addr_for_gw_and_sub
 
         # START test_23_n_create_route6_with_ipv4_subnet_for_destination
         self.log("info", "29. Create route6 item with subnet set to IPv4.")
         gwprops = '2001:bb::1:1'
         errors = [self.subnet_val_err, self.invalid_value.format(subprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_23_n_create_route6_with_ipv4_subnet_for_destination
 
         # START test_24_n_create_route6_with_local_link_address_for_subnet
@@ -327,7 +450,7 @@ class Story5175(GenericTest):
         subprops = 'fe80::900/48'
         err = "Cannot use link-local address fe80::/48 as subnet."
         errors = [self.subnet_val_err, err]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_24_n_create_route6_with_local_link_address_for_subnet
 
         # START test_25_n_create_route6_with_loopback_addr_for_sub_and_gw
@@ -336,7 +459,7 @@ class Story5175(GenericTest):
         props = '::1/128'
         errors = [self.subnet_val_err, self.gw_val_err, self.reserved_nw,
                   self.invalid_value.format(props)]
-        self.invalid_subnet_gateway_props(props, props, errors)
+        rows.append((props, props, errors))
         # END test_25_n_create_route6_with_loopback_addr_for_sub_and_gw
 
         # START test_26_n_create_route6_with_local_link_addr_for_sub_and_gw
@@ -347,7 +470,7 @@ class Story5175(GenericTest):
         err1 = "Cannot use link-local address {0} as subnet.".format(subprops)
         err2 = "The gateway address {0} cannot be link-local.".format(gwprops)
         errors = [self.subnet_val_err, self.gw_val_err, err1, err2]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_26_n_create_route6_with_local_link_addr_for_sub_and_gw
 
         # START test_27_n_create_route6_with_prefix_for_gateway
@@ -356,7 +479,7 @@ class Story5175(GenericTest):
         subprops = '3001:db8::/64'
         gwprops = '2001:DB8:0:0:800:27FF:FE00:0/64'
         errors = [self.gw_val_err, self.invalid_value.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_27_n_create_route6_with_prefix_for_gateway
 
         # START test_28_n_create_route6_with_reserved_address_for_subnet
@@ -368,10 +491,11 @@ class Story5175(GenericTest):
                             'f000::/5', 'fe00::/9']
 
         gwprops = "2001:DB8:0:0:800:27FF:FE00:0"
+        self._assert_reserved(subnets_to_check)
+        self._assert_reserved([gwprops], reserved=False)
         errors = [self.reserved_nw]
-        for subprops in subnets_to_check:
-            self.invalid_subnet_gateway_props(
-                subprops, gwprops, errors)
+        rows.extend((subprops, gwprops, errors)
+                    for subprops in subnets_to_check)
         # END test_28_n_create_route6_with_reserved_address_for_subnet
 
         # START test_29_n_create_route6_with_reserved_address_for_gateway
@@ -383,10 +507,10 @@ class Story5175(GenericTest):
                              'eabd::1', 'f0ac::2', 'fe0a:db8::1']
 
         subprops = '3001:db8::/64'
-        for gwprops in gateways_to_check:
-            errors = [self.reserved_gw.format(gwprops)]
-            self.invalid_subnet_gateway_props(
-                subprops, gwprops, errors)
+        self._assert_reserved(gateways_to_check)
+        self._assert_reserved([subprops], reserved=False)
+        rows.extend((subprops, gwprops, [self.reserved_gw.format(gwprops)])
+                    for gwprops in gateways_to_check)
         # END test_29_n_create_route6_with_reserved_address_for_gateway
 
         # START test_30_n_create_route6_with_reserved_addr_for_gw_and_sub
@@ -394,9 +518,10 @@ class Story5175(GenericTest):
                          "properties are set to a reserved network.")
         subprops = 'c000:db8::/3'
         gwprops = '00b8::0'
+        self._assert_reserved([subprops, gwprops])
         errors = [self.subnet_val_err, self.gw_val_err, self.reserved_nw,
                   self.reserved_gw.format(gwprops)]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_30_n_create_route6_with_reserved_addr_for_gw_and_sub
 
         # START test_32_n_route6_with_res_addr_for_sub_and_uniq_addr_for_gw
@@ -404,6 +529,19 @@ class Story5175(GenericTest):
                          "property is set to a reserved network.")
         subprops = 'c000:db8::/3'
         gwprops = '2001:D88::800:27FF:FE00:0'
+        self._assert_reserved([subprops])
+        self._assert_reserved([gwprops], reserved=False)
         errors = [self.reserved_nw]
-        self.invalid_subnet_gateway_props(subprops, gwprops, errors)
+        rows.append((subprops, gwprops, errors))
         # END test_32_n_route6_with_res_addr_for_sub_and_uniq_addr_for_gw
+
+        self.log("info", "38. Create route6 items where gateway property "
+                         "is set to generated addresses in the reserved "
+                         "IPv6 networks.")
+        subprops = '3001:db8::/64'
+        rows.extend((subprops, gwprops, [self.reserved_gw.format(gwprops)])
+                    for gwprops in self._get_reserved_gateways(20, seed=5175))
+
+        self.log("info", "39. Run the route6 creates of steps 1-38 and "
+                         "assert that each fails with its expected errors.")
+        self.invalid_subnet_gateway_props_batch(rows)